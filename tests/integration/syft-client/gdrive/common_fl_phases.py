@@ -0,0 +1,329 @@
+"""
+Common federated learning (FL) test phases for syft-client integration tests.
+
+These are reusable test functions for the syft-flwr specific part of the workflow,
+shared by the single-DO and two-DO FL tests:
+1. Bootstrap FL project (DS turns a Flower project into a syft-flwr project)
+2. Prepare, start and wait for the DS Flower server (`uv run main.py`)
+3. Verify trained weights (DS checks the aggregated model)
+
+The RDS phases around them (upload, discovery, approval) live in common_rds_phases.py.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from pathlib import Path
+
+from loguru import logger
+from syft_client.sync.syftbox_manager import SyftboxManager
+
+import syft_flwr
+
+from .utils import (
+    FL_PROJECT_DIR,
+    TEST_TMP_ROOT,
+    cached_project_venv,
+    clone_fl_project,
+    drop_log_cache,
+    kill_on_parent_death,
+    open_log_fd,
+    stat_weight_files,
+)
+
+# ==============================================================================
+# Phase: Bootstrap FL Project
+# ==============================================================================
+
+
+def ds_bootstrap_fl_project(ds_email: str, do_emails: list[str]) -> Path:
+    """DS bootstraps a temp copy of the FL project for P2P federated learning.
+
+    Args:
+        ds_email: Data Scientist's email (aggregator)
+        do_emails: Data Owners' emails (datasites)
+
+    Returns:
+        Path to the bootstrapped FL project
+    """
+    # Create temp directory for FL code
+    fl_temp_project = (
+        Path(tempfile.mkdtemp(dir=TEST_TMP_ROOT)) / "fl-diabetes-prediction"
+    )
+
+    # Check FL project exists
+    assert FL_PROJECT_DIR.exists(), f"FL project not found: {FL_PROJECT_DIR}"
+
+    # Clone FL project (hardlinks, except for files bootstrap rewrites). Leave out
+    # main.py: bootstrap() refuses to overwrite it and always writes its own.
+    clone_fl_project(FL_PROJECT_DIR, fl_temp_project, exclude=("main.py",))
+    logger.info(f"Cloned FL project to {fl_temp_project}")
+
+    # Bootstrap the project with syft_flwr
+    # This will:
+    # 1. Create main.py entry point that routes to client/server based on email
+    # 2. Update pyproject.toml with syft_flwr config
+    # Use P2P transport since tests use Google Drive API directly (like Colab notebooks)
+    syft_flwr.bootstrap(
+        fl_temp_project,
+        aggregator=ds_email,
+        datasites=do_emails,
+        transport="p2p",
+    )
+    logger.info(
+        "Bootstrapped project with:\n"
+        f"  - Aggregator (DS): {ds_email}\n"
+        f"  - Datasites (DOs): {do_emails}"
+    )
+
+    # Verify bootstrapped structure
+    assert (
+        fl_temp_project / "main.py"
+    ).exists(), "main.py should be created by bootstrap()"
+    assert (fl_temp_project / "fl_diabetes_prediction" / "task.py").exists()
+    assert (fl_temp_project / "pyproject.toml").exists()
+
+    # Verify bootstrap updated pyproject.toml
+    with open(fl_temp_project / "pyproject.toml", "rb") as f:
+        pyproject = tomllib.load(f)
+    assert (
+        "syft_flwr" in pyproject["tool"]
+    ), "Bootstrap should add [tool.syft_flwr] section"
+    assert pyproject["tool"]["syft_flwr"]["aggregator"] == ds_email
+    assert pyproject["tool"]["syft_flwr"]["datasites"] == do_emails
+
+    logger.success("✅ FL project bootstrapped and validated")
+    logger.info(f"Project path: {fl_temp_project}")
+
+    return fl_temp_project
+
+
+# ==============================================================================
+# Phase: Run DS Flower Server
+# ==============================================================================
+
+
+def ds_prepare_fl_server_env(
+    ds_manager: SyftboxManager,
+    ds_email: str,
+    ds_token_path: Path,
+    fl_project: Path,
+) -> tuple[dict, Path]:
+    """Build the environment the DS Flower server runs with.
+
+    Args:
+        ds_manager: Data Scientist's SyftboxManager
+        ds_email: Data Scientist's email
+        ds_token_path: Path to the DS OAuth token
+        fl_project: Path to the bootstrapped FL project
+
+    Returns:
+        Tuple of (environment dict, output dir where trained weights are saved)
+    """
+    ds_syftbox_folder = ds_manager.syftbox_folder
+
+    # Set OUTPUT_DIR for trained weights to be saved in DS's syftbox folder
+    output_dir = ds_syftbox_folder / ds_email / "fl_outputs"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    ds_env = os.environ.copy()
+    ds_env["SYFTBOX_EMAIL"] = ds_email
+    ds_env["SYFTBOX_FOLDER"] = str(ds_syftbox_folder)
+    ds_env["GDRIVE_TOKEN_PATH"] = str(ds_token_path)  # For GDriveFileIO authentication
+    ds_env["OUTPUT_DIR"] = str(output_dir)  # Where trained weights will be saved
+    # Reuse a warm venv across runs instead of a fresh .venv in the temp project
+    ds_env["UV_PROJECT_ENVIRONMENT"] = str(cached_project_venv(fl_project))
+
+    return ds_env, output_dir
+
+
+def ds_install_fl_dependencies(fl_project: Path, ds_env: dict) -> Path | None:
+    """Pre-install FL project dependencies (mirrors ds.ipynb cell JyInjbVp_ye6).
+
+    This ensures packages are ready before parallel execution starts.
+
+    Args:
+        fl_project: Path to the bootstrapped FL project
+        ds_env: Environment from ds_prepare_fl_server_env()
+
+    Returns:
+        The synced venv's Python interpreter, or None if `uv sync` failed
+    """
+    logger.info("Pre-installing FL project dependencies...")
+    install_result = subprocess.run(
+        ["uv", "sync"],
+        cwd=str(fl_project),
+        env=ds_env,
+        stdout=subprocess.DEVNULL,  # Only stderr is reported, don't buffer stdout
+        stderr=subprocess.PIPE,
+        timeout=300,  # 5 min timeout for installation
+    )
+    if install_result.returncode != 0:
+        logger.warning(f"uv sync warning: {install_result.stderr.decode()}")
+        return None
+
+    logger.success("Dependencies installed successfully")
+    venv_dir = Path(ds_env["UV_PROJECT_ENVIRONMENT"])
+    return venv_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+
+def ds_start_fl_server(
+    fl_project: Path,
+    ds_env: dict,
+    stdout_path: Path,
+    stderr_path: Path,
+    python: Path | None = None,
+) -> subprocess.Popen:
+    """Start DS Flower server via uv run main.py (mirrors ds.ipynb cell KxOOWlwm_3MB).
+
+    Args:
+        fl_project: Path to the bootstrapped FL project
+        ds_env: Environment from ds_prepare_fl_server_env()
+        stdout_path: Where to write the server's stdout
+        stderr_path: Where to write the server's stderr
+        python: Interpreter of an already synced venv. When given, main.py runs
+            on it directly, skipping `uv run`'s lockfile and environment checks.
+
+    Returns:
+        The running server process, to be waited on with wait_for_fl_run()
+    """
+    main_py = str(fl_project / "main.py")
+    command = [str(python), main_py] if python else ["uv", "run", main_py]
+    logger.info(
+        f"Starting DS Flower server: {' '.join(command)}\n"
+        f"  SYFTBOX_EMAIL={ds_env['SYFTBOX_EMAIL']}\n"
+        f"  SYFTBOX_FOLDER={ds_env['SYFTBOX_FOLDER']}\n"
+        f"  Logs: {stdout_path}, {stderr_path}"
+    )
+
+    # Open raw log descriptors the server writes to directly. The server
+    # inherits its own copies, so ours are closed as soon as it has started;
+    # wait_for_fl_run() drops the written logs from the page cache at the end.
+    ds_stdout_fd = open_log_fd(stdout_path)
+    ds_stderr_fd = open_log_fd(stderr_path)
+    try:
+        return subprocess.Popen(
+            command,
+            cwd=str(fl_project),
+            env=ds_env,
+            stdout=ds_stdout_fd,
+            stderr=ds_stderr_fd,
+            # Don't leave the server running if the test process dies
+            preexec_fn=kill_on_parent_death if sys.platform == "linux" else None,
+        )
+    finally:
+        os.close(ds_stdout_fd)
+        os.close(ds_stderr_fd)
+
+
+def wait_for_fl_run(
+    ds_process: subprocess.Popen,
+    clients: list,
+    ds_timeout: float = 600,
+    clients_timeout: float = 660,
+    poll_interval: float = 0.2,
+    ds_log_paths: tuple[Path, ...] = (),
+) -> dict:
+    """Wait for the DS server and the DO clients from the calling thread.
+
+    The server process is polled next to the clients instead of parking a
+    separate thread on it, and is killed once ``ds_timeout`` expires.
+
+    Args:
+        ds_process: Server process from ds_start_fl_server()
+        clients: DO client threads or processes (anything with ``is_alive()``)
+        ds_timeout: Seconds before the server is killed (10 min)
+        clients_timeout: Seconds to wait for the clients (11 min)
+        poll_interval: Seconds between checks
+        ds_log_paths: Server log files to drop from the page cache once it exits
+
+    Returns:
+        DS result dict with 'success' and 'error' keys
+    """
+    ds_result = {"success": False, "error": None}
+    start_time = time.monotonic()
+
+    while True:
+        elapsed = time.monotonic() - start_time
+        if ds_process.poll() is None and elapsed > ds_timeout:
+            ds_process.kill()
+            ds_process.wait()
+            ds_result["error"] = f"DS server timed out after {ds_timeout:.0f}s"
+            logger.error(ds_result["error"])
+
+        clients_running = elapsed < clients_timeout and any(
+            client.is_alive() for client in clients
+        )
+        if ds_process.returncode is not None and not clients_running:
+            break
+        time.sleep(poll_interval)
+
+    # The server has exited, so its logs are complete and no longer need caching
+    drop_log_cache(*ds_log_paths)
+
+    if ds_result["error"] is None:
+        if ds_process.returncode == 0:
+            ds_result["success"] = True
+            logger.success("DS Flower server completed successfully")
+        else:
+            ds_result["error"] = f"DS server exited with code {ds_process.returncode}"
+            logger.error(ds_result["error"])
+
+    return ds_result
+
+
+# ==============================================================================
+# Phase: Verify Trained Weights
+# ==============================================================================
+
+
+def ds_verify_trained_weights(fl_output_dir: Path | None):
+    """DS verifies that the FL server saved loadable trained weights.
+
+    Args:
+        fl_output_dir: OUTPUT_DIR the DS server ran with (None to use the default)
+    """
+    logger.info("\n" + "=" * 60 + "\nVERIFYING TRAINED WEIGHTS FOR DS\n" + "=" * 60)
+
+    # Weights are saved to OUTPUT_DIR/weights/ (set in Phase 8)
+    if fl_output_dir:
+        weights_dir = fl_output_dir / "weights"
+    else:
+        # Fallback to default path
+        weights_dir = Path.home() / ".syftbox" / "rds" / "weights"
+
+    logger.info(f"Checking weights directory: {weights_dir}")
+
+    assert weights_dir.exists(), f"Weights directory not found: {weights_dir}"
+
+    # Find all .safetensors weight files, stat-ing each one only once
+    weight_stats = stat_weight_files(weights_dir)
+    # One record for the whole listing, not one per weight file
+    lines = [
+        f"  - {wf.name} ({weight_stats[wf].st_size} bytes)"
+        for wf in sorted(weight_stats)
+    ]
+    logger.info(f"Found {len(weight_stats)} weight file(s):\n" + "\n".join(lines))
+
+    # Verify at least one weight file exists (from at least one FL round)
+    assert len(weight_stats) > 0, "No trained weight files found!"
+
+    # Verify the latest weights file is readable
+    latest_weights = max(weight_stats, key=lambda p: weight_stats[p].st_mtime)
+    assert weight_stats[latest_weights].st_size > 0, "Latest weights file is empty!"
+    logger.success(f"✅ DS can access trained weights: {latest_weights.name}")
+
+    # Verify the weights structure from the header, loading a single tensor only
+    from safetensors import safe_open
+
+    with safe_open(str(latest_weights), framework="numpy") as weights:
+        layer_names = list(weights.keys())
+        logger.info(f"  Weight layers: {layer_names}")
+        assert layer_names, "Latest weights file has no layers!"
+        weights.get_tensor(layer_names[0])
+    logger.success("✅ Trained weights verified and loadable!")
+
+    logger.info("=" * 60)
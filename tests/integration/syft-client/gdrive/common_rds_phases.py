@@ -11,15 +11,16 @@ Each test file imports and calls these phases, then implements
 workflow-specific phases (e.g., FL bootstrap, result verification).
 """
 
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import sleep
 
-from googleapiclient.errors import HttpError
 from loguru import logger
 from syft_client.sync.syftbox_manager import SyftboxManager
 
-from .utils import has_file
+from .utils import call_with_backoff, has_file, wait_until
 
 # ==============================================================================
 # Phase: Upload Datasets
@@ -84,24 +85,35 @@ def dos_upload_datasets(syft_managers, dataset_dir):
     ), f"DS should have 2 peers before upload, got {len(ds_peer_emails)}: {ds_peer_emails}"
     logger.info("✅ Verified DS has 2 peers before dataset upload")
 
-    # DO1 uploads partition 0
-    do_upload_dataset(
-        do_manager=syft_managers["do1"],
-        dataset_dir=dataset_dir,
-        partition_index=0,
-        do_name="DO1",
-    )
-
-    # DO2 uploads partition 1
-    do_upload_dataset(
-        do_manager=syft_managers["do2"],
-        dataset_dir=dataset_dir,
-        partition_index=1,
-        do_name="DO2",
-    )
+    # DO1 uploads partition 0 and DO2 uploads partition 1. Each DO has its own
+    # manager and Drive folder, so both uploads (and their syncs) run at once.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        uploads = [
+            executor.submit(
+                do_upload_dataset,
+                do_manager=syft_managers[do_key],
+                dataset_dir=dataset_dir,
+                partition_index=partition_index,
+                do_name=do_key.upper(),
+            )
+            for partition_index, do_key in enumerate(("do1", "do2"))
+        ]
+        for upload in uploads:
+            upload.result()  # Re-raise assertion errors from the upload
 
     # Wait for sync to propagate through Google Drive
-    sleep(3)
+    env = syft_managers["env"]
+
+    def _ds_sees_datasets():
+        # One sync per poll, then read the local dataset manager: `.datasets`
+        # would sync again on every access
+        ds_manager.sync()
+        return all(
+            ds_manager.dataset_manager.get_all(datasite=env[email_key])
+            for email_key in ("EMAIL_DO1", "EMAIL_DO2")
+        )
+
+    assert wait_until(_ds_sees_datasets), "Uploaded datasets did not sync to the DS"
     logger.success("✅ Both datasets uploaded and synced")
 
 
@@ -114,46 +126,65 @@ def ds_discover_dataset_from_do(
     ds_manager: SyftboxManager,
     do_email: str,
     do_name: str = "DO",
-    max_retries: int = 5,
-    retry_delay: int = 5,
+    max_retries: int = 6,
+    retry_delay: float = 1,
+    max_retry_delay: float = 60,
 ):
     """DS discovers dataset from a single DO.
 
+    Datasets already synced into the DS's syftbox (e.g. by the sync done while
+    discovering another DO) are used without syncing again. Otherwise retries
+    back off exponentially (1s, 2s, 4s, ... by default, plus a little jitter),
+    and a successful attempt returns without sleeping.
+
     Args:
         ds_manager: Data Scientist's SyftboxManager
         do_email: Data Owner's email address
         do_name: Name for logging (e.g., "DO1", "DO2")
         max_retries: Number of sync retries
-        retry_delay: Delay between retries in seconds
+        retry_delay: Delay before the first retry in seconds
+        max_retry_delay: Upper bound for the delay between retries in seconds
 
     Returns:
-        List of discovered datasets from the DO
+        Dict of discovered datasets from the DO, keyed by dataset name
     """
-    datasets = []
+    # sync() pulls every peer's datasets, so they may already be here. Read the
+    # local dataset manager: `.datasets` would sync with Drive before returning.
+    datasets = ds_manager.dataset_manager.get_all(datasite=do_email)
+    if datasets:
+        logger.info(f"{do_name}'s datasets are already synced, skipping sync")
 
     for attempt in range(max_retries):
+        if len(datasets) > 0:
+            break
+
         logger.info(
             f"DS syncing to receive dataset metadata from {do_name} "
             f"(attempt {attempt + 1}/{max_retries})..."
         )
         ds_manager.sync()
-        sleep(retry_delay)
 
         logger.info(f"Discovering datasets from {do_name} ({do_email})...")
-        datasets = ds_manager.datasets.get_all(datasite=do_email)
+        datasets = ds_manager.dataset_manager.get_all(datasite=do_email)  # Synced
         logger.info(f"Found {len(datasets)} dataset(s) from {do_name}")
 
-        if len(datasets) > 0:
-            break
-
-        if attempt < max_retries - 1:
-            logger.warning(f"Datasets not yet synced, retrying in {retry_delay}s...")
+        if len(datasets) == 0 and attempt < max_retries - 1:
+            delay = min(retry_delay * 2**attempt, max_retry_delay)
+            delay += random.uniform(0, delay * 0.1)
+            logger.warning(f"Datasets not yet synced, retrying in {delay:.1f}s...")
+            sleep(delay)
 
     assert len(datasets) > 0, f"No datasets found from {do_name} ({do_email})"
-    assert datasets[0].name == "pima-indians-diabetes-database"
-    logger.success(f"✅ DS discovered dataset from {do_name}: {datasets[0].name}")
+    # Look datasets up by name, so the check doesn't depend on get_all()'s order
+    datasets_by_name = {d.name: d for d in datasets}
+    assert (
+        "pima-indians-diabetes-database" in datasets_by_name
+    ), f"Diabetes dataset not found from {do_name}: {sorted(datasets_by_name)}"
+    logger.success(
+        f"✅ DS discovered dataset(s) from {do_name}: {sorted(datasets_by_name)}"
+    )
 
-    return datasets
+    return datasets_by_name
 
 
 def ds_discover_datasets(syft_managers):
@@ -169,31 +200,30 @@ def ds_discover_datasets(syft_managers):
 
     # Verify peers are still connected
     peers = ds_manager.peers
-    peer_emails = [p.email for p in peers]
-    logger.info(f"DS peers after sync: {peer_emails}")
+    peer_emails = {p.email for p in peers}
+    peer_email_list = sorted(peer_emails)  # Stable order for logging
+    logger.info(f"DS peers after sync: {peer_email_list}")
     logger.info(f"Expected peers: [{env['EMAIL_DO1']}, {env['EMAIL_DO2']}]")
 
     assert (
-        len(peer_emails) == 2
-    ), f"DS should have 2 peers, got {len(peer_emails)}: {peer_emails}"
-    assert env["EMAIL_DO1"] in peer_emails, f"DO1 not in peers: {peer_emails}"
-    assert env["EMAIL_DO2"] in peer_emails, f"DO2 not in peers: {peer_emails}"
-    logger.success(f"✅ DS has {len(peers)} peers: {peer_emails}")
+        len(peers) == 2
+    ), f"DS should have 2 peers, got {len(peers)}: {peer_email_list}"
+    assert env["EMAIL_DO1"] in peer_emails, f"DO1 not in peers: {peer_email_list}"
+    assert env["EMAIL_DO2"] in peer_emails, f"DO2 not in peers: {peer_email_list}"
+    logger.success(f"✅ DS has {len(peers)} peers: {peer_email_list}")
 
     # Discover datasets from both DOs
-    ds_discover_dataset_from_do(ds_manager, env["EMAIL_DO1"], "DO1")
+    do1_datasets = ds_discover_dataset_from_do(ds_manager, env["EMAIL_DO1"], "DO1")
     ds_discover_dataset_from_do(ds_manager, env["EMAIL_DO2"], "DO2")
 
-    # Verify DS can access mock data
-    do1_dataset = ds_manager.datasets.get(
-        "pima-indians-diabetes-database", datasite=env["EMAIL_DO1"]
-    )
+    # Verify DS can access mock data, reusing the dataset loaded during discovery
+    # rather than loading it again
+    do1_dataset = do1_datasets["pima-indians-diabetes-database"]
     assert do1_dataset.mock_dir is not None, "Mock directory should be accessible"
 
-    # Check mock file exists in DS's syftbox
-    assert has_file(
-        ds_manager.syftbox_folder, "train.csv"
-    ), "Mock data not synced to DS"
+    # Check the mock file was synced into the dataset's mock dir, instead of
+    # walking the DS's whole syftbox for it
+    assert has_file(do1_dataset.mock_dir, "train.csv"), "Mock data not synced to DS"
     logger.success("✅ DS can access mock data")
 
     # Verify private data is NOT accessible
@@ -239,8 +269,12 @@ def dos_approve_jobs(syft_managers):
     """
     logger.info("DOs approving jobs...")
 
-    do_approve_jobs(syft_managers["do1"], "DO1")
-    do_approve_jobs(syft_managers["do2"], "DO2")
+    # Each DO approves through its own manager, so both can run at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        do1_approval = executor.submit(do_approve_jobs, syft_managers["do1"], "DO1")
+        do2_approval = executor.submit(do_approve_jobs, syft_managers["do2"], "DO2")
+        do1_approval.result()  # Re-raise assertion errors from the workers
+        do2_approval.result()
 
     logger.success("✅ Both DOs approved jobs")
 
@@ -263,46 +297,30 @@ def do_execute_jobs(
         max_retries: Number of retries for transient Google API errors
 
     Returns:
-        Duration in seconds
+        Duration in seconds, including any failed attempts and backoff
     """
     logger.info(f"{do_name} processing approved jobs...")
 
-    for attempt in range(max_retries):
-        try:
-            start_time = time.time()
-            do_manager.process_approved_jobs()
-            duration = time.time() - start_time
-            logger.success(f"✅ {do_name} completed job in {duration:.1f}s")
-            return duration
-        except HttpError as e:
-            if e.resp.status in [500, 502, 503, 504] and attempt < max_retries - 1:
-                logger.warning(
-                    f"{do_name} got transient Google API error "
-                    f"(attempt {attempt + 1}/{max_retries}), retrying..."
-                )
-                sleep(2)
-            else:
-                raise
-
-    return 0.0
-
-
-def dos_execute_jobs(syft_managers):
-    """DOs execute approved jobs on their private data (convenience wrapper for 2 DOs).
-
-    Args:
-        syft_managers: Dict with 'ds', 'do1', 'do2', 'env' managers
+    # perf_counter is monotonic and high-resolution, unlike time.time()
+    start_time = time.perf_counter()
+    last_attempt_start = start_time
 
-    Returns:
-        Tuple of (do1_duration, do2_duration) in seconds
-    """
-    logger.info("Executing jobs...")
-
-    duration_do1 = do_execute_jobs(syft_managers["do1"], "DO1")
-    duration_do2 = do_execute_jobs(syft_managers["do2"], "DO2")
+    def _process_approved_jobs():
+        nonlocal last_attempt_start
+        last_attempt_start = time.perf_counter()
+        do_manager.process_approved_jobs()
 
+    call_with_backoff(
+        _process_approved_jobs,
+        max_attempts=max_retries,
+        description=f"{do_name} processing approved jobs",
+    )
+    duration = time.perf_counter() - start_time
+    # Time spent on failed attempts and backoff, so retry noise isn't mistaken
+    # for slower job execution
+    retry_time = last_attempt_start - start_time
     logger.success(
-        f"✅ Both DOs executed jobs (DO1: {duration_do1:.1f}s, DO2: {duration_do2:.1f}s)"
+        f"✅ {do_name} completed job in {duration:.1f}s "
+        f"({retry_time:.1f}s of it in retries)"
     )
-
-    return duration_do1, duration_do2
+    return duration
@@ -22,12 +22,13 @@ import pytest
 from dotenv import load_dotenv
 from huggingface_hub import snapshot_download
 from loguru import logger
-from syft_client.sync.syftbox_manager import SyftboxManager, SyftboxManagerConfig
+from syft_client.sync.syftbox_manager import SyftboxManager
 
 from .utils import (
     CREDENTIALS_DIR,
     ENV_FILE,
     SCOPES,
+    create_drive_manager,
     create_token,
     remove_syftbox_single_do_from_drive,
     remove_syftboxes_from_drive,
@@ -159,18 +160,7 @@ def create_single_manager(
     """
     logger.debug(f"[DEBUG] Creating manager for {email} (is_ds={is_ds})")
 
-    config = SyftboxManagerConfig.for_google_drive_testing_connection(
-        email=email,
-        token_path=token_path,
-        use_in_memory_cache=False,
-        only_ds=is_ds,
-        only_datasite_owner=not is_ds,
-    )
-    logger.debug(
-        f"[DEBUG] Config created for {email}, syftbox_folder={config.syftbox_folder}"
-    )
-
-    manager = SyftboxManager.from_config(config)
+    manager = create_drive_manager(email, token_path, is_ds=is_ds)
     logger.debug(
         f"[DEBUG] Manager created for {email}, syftbox_folder={manager.syftbox_folder}"
     )
@@ -226,9 +216,12 @@ def create_single_manager(
 # ==============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def validate_environment():
-    """Verify all prerequisites are met before running tests."""
+    """Verify all prerequisites are met before running tests.
+
+    Session-scoped: credentials and tokens don't change between test modules.
+    """
     logger.info("Phase 0: Validating environment...")
 
     _load_env_file()
@@ -300,9 +293,13 @@ def cleanup_drive(validate_environment):
     logger.info(f"  - DS workspace: {env['EMAIL_DS']}")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def prepare_datasets():
-    """Download diabetes dataset partitions from HuggingFace."""
+    """Download diabetes dataset partitions from HuggingFace.
+
+    Session-scoped: uploads only copy the partitions, so one download serves
+    every test module.
+    """
     logger.info("Phase 1: Downloading datasets from HuggingFace...")
 
     dataset_dir = Path(tempfile.mkdtemp()) / "diabetes_dataset"
@@ -347,6 +344,11 @@ def syft_managers(cleanup_drive, validate_environment):
     Creates each manager individually using SyftboxManagerConfig to avoid
     the cross-contamination issues that occur when pair_with_google_drive_testing_connection()
     is called multiple times (which creates duplicate DS managers).
+
+    Module-scoped: the managers are created once and shared by all phases of a
+    test module, which also store intermediate results (e.g. "fl_project") in the
+    returned dict for later phases to pick up. They are deliberately not shared
+    across modules: each module starts from a freshly cleaned Drive.
     """
     logger.info("Phase 2: Initializing syft-client managers...")
 
@@ -423,7 +425,7 @@ def syft_managers(cleanup_drive, validate_environment):
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def validate_environment_single_do():
     """Verify prerequisites for single-DO tests (DO1 + DS only)."""
     logger.info("Phase 0: Validating environment (single DO)...")
@@ -488,6 +490,8 @@ def syft_managers_single_do(cleanup_drive_single_do, validate_environment_single
 
     This fixture is optimized for single-DO tests that don't need DO2.
     Creates each manager individually using SyftboxManagerConfig.
+
+    Module-scoped and shared across phases, like `syft_managers`.
     """
     logger.info("Phase 2: Initializing syft-client managers (single DO)...")
 
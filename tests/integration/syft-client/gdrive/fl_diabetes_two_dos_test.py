@@ -36,26 +36,28 @@ Setup:
 
 import multiprocessing
 import os
+import queue
 import shutil
-import subprocess
-import tempfile
-import threading
 import time
-from pathlib import Path
 from time import sleep
 
 import pytest
-import tomli
 from loguru import logger
 
-import syft_flwr
-
+from .common_fl_phases import (
+    ds_bootstrap_fl_project,
+    ds_install_fl_dependencies,
+    ds_prepare_fl_server_env,
+    ds_start_fl_server,
+    ds_verify_trained_weights,
+    wait_for_fl_run,
+)
 from .common_rds_phases import (
     dos_approve_jobs,
     dos_upload_datasets,
     ds_discover_datasets,
 )
-from .utils import FL_PROJECT_DIR, TEST_LOGS_DIR
+from .utils import TEST_LOGS_DIR, clip_log, sync_managers, wait_until
 
 # Mark all tests in this module as slow (integration tests)
 pytestmark = pytest.mark.slow
@@ -72,7 +74,7 @@ def _run_do_client_process(
     job_location_str: str,
     stdout_path: str,
     stderr_path: str,
-    result_dict: dict,
+    result_queue: multiprocessing.Queue,
 ):
     """Run DO Flower client in isolated subprocess.
 
@@ -87,7 +89,7 @@ def _run_do_client_process(
         job_location_str: Path to job folder (for log copying)
         stdout_path: Where to copy stdout log
         stderr_path: Where to copy stderr log
-        result_dict: Shared dict for returning results (multiprocessing.Manager().dict())
+        result_queue: Queue the result dict is posted to exactly once, on exit
     """
     import time
     from pathlib import Path
@@ -95,6 +97,7 @@ def _run_do_client_process(
     from loguru import logger
     from syft_client.sync.syftbox_manager import SyftboxManager, SyftboxManagerConfig
 
+    result = {"success": False, "error": None, "duration": 0.0}
     try:
         # Set environment in this isolated process
         os.environ["GDRIVE_TOKEN_PATH"] = token_path
@@ -130,12 +133,12 @@ def _run_do_client_process(
         do_manager.process_approved_jobs()
         duration = time.time() - start_time
 
-        result_dict["success"] = True
-        result_dict["duration"] = duration
+        result["success"] = True
+        result["duration"] = duration
         logger.success(f"[Subprocess] {do_email} completed in {duration:.1f}s")
 
     except Exception as e:
-        result_dict["error"] = str(e)
+        result["error"] = str(e)
         logger.error(f"[Subprocess] {do_email} error: {e}")
         import traceback
 
@@ -156,6 +159,23 @@ def _run_do_client_process(
                 )
             except Exception as log_err:
                 logger.warning(f"[Subprocess] Could not copy logs: {log_err}")
+        result_queue.put(result)
+
+
+def _collect_do_result(result_queue: multiprocessing.Queue) -> dict:
+    """Get the result posted by `_run_do_client_process`, or an error if there is none.
+
+    Call after joining the DO process; a process that timed out or was killed
+    never posts its result.
+    """
+    try:
+        return result_queue.get(timeout=1)
+    except queue.Empty:
+        return {
+            "success": False,
+            "error": "DO client exited without reporting a result",
+            "duration": 0.0,
+        }
 
 
 # ==============================================================================
@@ -192,58 +212,10 @@ def test_phase_05_bootstrap_fl_project(syft_managers):
     logger.info("Phase 5: Bootstrapping FL project for distributed execution...")
 
     env = syft_managers["env"]
-    ds_email = env["EMAIL_DS"]
-    do_emails = [env["EMAIL_DO1"], env["EMAIL_DO2"]]
-
-    # Create temp directory for FL code
-    fl_temp_project = Path(tempfile.mkdtemp()) / "fl-diabetes-prediction"
-
-    # Check FL project exists
-    assert FL_PROJECT_DIR.exists(), f"FL project not found: {FL_PROJECT_DIR}"
-
-    # Copy FL project
-    shutil.copytree(FL_PROJECT_DIR, fl_temp_project)
-    logger.info(f"Copied FL project to {fl_temp_project}")
-
-    # Remove existing main.py if it exists (bootstrap() will create a new one)
-    existing_main_py = fl_temp_project / "main.py"
-    if existing_main_py.exists():
-        existing_main_py.unlink()
-        logger.info("Removed existing main.py (bootstrap will create new one)")
-
-    # Bootstrap the project with syft_flwr
-    # This will:
-    # 1. Create main.py entry point that routes to client/server based on email
-    # 2. Update pyproject.toml with syft_flwr config
-    # Use P2P transport since tests use Google Drive API directly (like Colab notebooks)
-    syft_flwr.bootstrap(
-        fl_temp_project,
-        aggregator=ds_email,
-        datasites=do_emails,
-        transport="p2p",
+    fl_temp_project = ds_bootstrap_fl_project(
+        ds_email=env["EMAIL_DS"],
+        do_emails=[env["EMAIL_DO1"], env["EMAIL_DO2"]],
     )
-    logger.info("Bootstrapped project with:")
-    logger.info(f"  - Aggregator (DS): {ds_email}")
-    logger.info(f"  - Datasites (DOs): {do_emails}")
-
-    # Verify bootstrapped structure
-    assert (
-        fl_temp_project / "main.py"
-    ).exists(), "main.py should be created by bootstrap()"
-    assert (fl_temp_project / "fl_diabetes_prediction" / "task.py").exists()
-    assert (fl_temp_project / "pyproject.toml").exists()
-
-    # Verify bootstrap updated pyproject.toml
-    with open(fl_temp_project / "pyproject.toml", "rb") as f:
-        pyproject = tomli.load(f)
-    assert (
-        "syft_flwr" in pyproject["tool"]
-    ), "Bootstrap should add [tool.syft_flwr] section"
-    assert pyproject["tool"]["syft_flwr"]["aggregator"] == ds_email
-    assert set(pyproject["tool"]["syft_flwr"]["datasites"]) == set(do_emails)
-
-    logger.success("✅ FL project bootstrapped and validated")
-    logger.info(f"Project path: {fl_temp_project}")
 
     # Store for later phases
     syft_managers["fl_project"] = fl_temp_project
@@ -271,26 +243,25 @@ def test_phase_06_submit_fl_jobs(syft_managers):
     # The folder contains: main.py (entry point), pyproject.toml, and fl_diabetes_prediction/
     logger.info(f"FL project folder: {fl_project}")
 
-    # Submit job to DO1
-    logger.info(f"Submitting FL job to {env['EMAIL_DO1']}...")
-    ds_manager.submit_python_job(
-        user=env["EMAIL_DO1"],
-        code_path=str(fl_project),
-        job_name="fl-diabetes-training",
-    )
-    logger.success("✅ FL job submitted to DO1")
-
-    # Submit job to DO2
-    logger.info(f"Submitting FL job to {env['EMAIL_DO2']}...")
-    ds_manager.submit_python_job(
-        user=env["EMAIL_DO2"],
-        code_path=str(fl_project),
-        job_name="fl-diabetes-training",
-    )
-    logger.success("✅ FL job submitted to DO2")
+    # Submissions must stay sequential: they share the DS manager's file change
+    # pusher, whose queue is drained into a single message for the last recipient,
+    # so concurrent submissions could route one DO's job files to the other DO.
+    for do_name in ("DO1", "DO2"):
+        do_email = env[f"EMAIL_{do_name}"]
+        logger.info(f"Submitting FL job to {do_email}...")
+        ds_manager.submit_python_job(
+            user=do_email,
+            code_path=str(fl_project),
+            job_name="fl-diabetes-training",
+        )
+        logger.success(f"✅ FL job submitted to {do_name}")
 
-    # Wait for jobs to propagate
-    sleep(2)
+    # Wait for jobs to propagate (`.jobs` syncs the DO on every call)
+    for do_name in ("DO1", "DO2"):
+        do_manager = syft_managers[do_name.lower()]
+        assert wait_until(
+            lambda: len(do_manager.jobs) > 0
+        ), f"FL job did not propagate to {do_name}"
 
     logger.success("✅ Phase 6 complete: FL jobs submitted to both DOs")
 
@@ -333,125 +304,62 @@ def test_phase_08_execute_fl_jobs(syft_managers):
     assert fl_project is not None, "FL project not bootstrapped - run phase 5 first"
 
     # Prepare environment for DS server
-    ds_email = env["EMAIL_DS"]
-    ds_syftbox_folder = ds_manager.syftbox_folder
-    ds_token_path = env["token_path_ds"]
-
-    # Set OUTPUT_DIR for trained weights to be saved in DS's syftbox folder
-    output_dir = ds_syftbox_folder / ds_email / "fl_outputs"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    ds_env = os.environ.copy()
-    ds_env["SYFTBOX_EMAIL"] = ds_email
-    ds_env["SYFTBOX_FOLDER"] = str(ds_syftbox_folder)
-    ds_env["GDRIVE_TOKEN_PATH"] = str(ds_token_path)  # For GDriveFileIO authentication
-    ds_env["OUTPUT_DIR"] = str(output_dir)  # Where trained weights will be saved
+    ds_env, output_dir = ds_prepare_fl_server_env(
+        ds_manager=ds_manager,
+        ds_email=env["EMAIL_DS"],
+        ds_token_path=env["token_path_ds"],
+        fl_project=fl_project,
+    )
 
     # Store output_dir for Phase 9 verification
     syft_managers["fl_output_dir"] = output_dir
 
-    # DS result container (local, not shared across processes)
-    ds_result = {"success": False, "error": None, "process": None}
-
     # Log files for debugging (stream output in real-time)
-    # Clear old logs before each test run
-    if TEST_LOGS_DIR.exists():
-        shutil.rmtree(TEST_LOGS_DIR)
-    TEST_LOGS_DIR.mkdir(exist_ok=True)
     ds_stdout_path = TEST_LOGS_DIR / "ds_stdout.log"
     ds_stderr_path = TEST_LOGS_DIR / "ds_stderr.log"
     do1_stdout_path = TEST_LOGS_DIR / "do1_stdout.log"
     do1_stderr_path = TEST_LOGS_DIR / "do1_stderr.log"
     do2_stdout_path = TEST_LOGS_DIR / "do2_stdout.log"
     do2_stderr_path = TEST_LOGS_DIR / "do2_stderr.log"
+    # Clear old logs before each test run by truncating them in place
+    TEST_LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    for log_path in (
+        ds_stdout_path,
+        ds_stderr_path,
+        do1_stdout_path,
+        do1_stderr_path,
+        do2_stdout_path,
+        do2_stderr_path,
+    ):
+        log_path.write_bytes(b"")
     logger.info(f"All logs will be written to: {TEST_LOGS_DIR}")
 
-    # Get DO job locations for log access
-    do1_jobs = do1_manager.jobs
-    do1_approved = [j for j in do1_jobs if j.status == "approved"]
-    do1_job_location = do1_approved[0].location if do1_approved else None
+    # Get DO job locations for log access. Sync both DOs at once, then read the
+    # local job lists (`.jobs` would sync each DO again, one after the other).
+    sync_managers(do1_manager, do2_manager)
+    do1_approved = next(
+        (j for j in do1_manager.job_client.jobs if j.status == "approved"), None
+    )
+    do1_job_location = do1_approved.location if do1_approved else None
     if do1_job_location:
         logger.info(f"DO1 job location: {do1_job_location}")
 
-    do2_jobs = do2_manager.jobs
-    do2_approved = [j for j in do2_jobs if j.status == "approved"]
-    do2_job_location = do2_approved[0].location if do2_approved else None
+    do2_approved = next(
+        (j for j in do2_manager.job_client.jobs if j.status == "approved"), None
+    )
+    do2_job_location = do2_approved.location if do2_approved else None
     if do2_job_location:
         logger.info(f"DO2 job location: {do2_job_location}")
 
-    # Pre-install dependencies (mirrors ds.ipynb cell JyInjbVp_ye6)
-    # This ensures packages are ready before parallel execution starts
-    logger.info("Pre-installing FL project dependencies...")
-    install_result = subprocess.run(
-        ["uv", "sync"],
-        cwd=str(fl_project),
-        env=ds_env,
-        capture_output=True,
-        timeout=300,  # 5 min timeout for installation
-    )
-    if install_result.returncode != 0:
-        logger.warning(f"uv sync warning: {install_result.stderr.decode()}")
-    else:
-        logger.success("Dependencies installed successfully")
-
-    def run_ds_server():
-        """Run DS Flower server via uv run main.py (mirrors ds.ipynb cell KxOOWlwm_3MB)"""
-        ds_stdout_file = None
-        ds_stderr_file = None
-        try:
-            logger.info(f"Starting DS Flower server: uv run {fl_project / 'main.py'}")
-            logger.info(f"  SYFTBOX_EMAIL={ds_email}")
-            logger.info(f"  SYFTBOX_FOLDER={ds_syftbox_folder}")
-            logger.info(f"  Logs: {ds_stdout_path}, {ds_stderr_path}")
-
-            # Open log files for streaming output
-            ds_stdout_file = open(ds_stdout_path, "w")
-            ds_stderr_file = open(ds_stderr_path, "w")
-
-            process = subprocess.Popen(
-                ["uv", "run", str(fl_project / "main.py")],
-                cwd=str(fl_project),
-                env=ds_env,
-                stdout=ds_stdout_file,
-                stderr=ds_stderr_file,
-            )
-            ds_result["process"] = process
-
-            # Wait for process to complete
-            process.wait(timeout=600)  # 10 min timeout
-
-            if process.returncode == 0:
-                ds_result["success"] = True
-                logger.success("DS Flower server completed successfully")
-            else:
-                ds_result["error"] = f"DS server exited with code {process.returncode}"
-                logger.error(ds_result["error"])
-
-        except subprocess.TimeoutExpired:
-            if ds_result["process"]:
-                ds_result["process"].kill()
-            ds_result["error"] = "DS server timed out after 10 minutes"
-            logger.error(ds_result["error"])
-        except Exception as e:
-            ds_result["error"] = str(e)
-            logger.error(f"DS server error: {e}")
-        finally:
-            if ds_stdout_file:
-                ds_stdout_file.close()
-            if ds_stderr_file:
-                ds_stderr_file.close()
-            logger.info(f"DS logs saved to: {ds_stdout_path}, {ds_stderr_path}")
+    # Pre-install dependencies so packages are ready before parallel execution
+    ds_python = ds_install_fl_dependencies(fl_project, ds_env)
 
     # Start all three in parallel (mirrors running DS, DO1, DO2 notebooks simultaneously)
     start_time = time.time()
 
-    # Use multiprocessing.Manager for shared result dicts
-    mp_manager = multiprocessing.Manager()
-    do1_result = mp_manager.dict({"success": False, "error": None, "duration": 0.0})
-    do2_result = mp_manager.dict({"success": False, "error": None, "duration": 0.0})
-
-    # DS runs as thread (uses subprocess.Popen internally)
-    ds_thread = threading.Thread(target=run_ds_server, name="DS-Server")
+    # Each DO process posts its result dict once, no shared-state server needed
+    do1_queue = multiprocessing.Queue()
+    do2_queue = multiprocessing.Queue()
 
     # DO1 and DO2 run as separate PROCESSES with isolated os.environ
     # This allows them to run in PARALLEL without GDRIVE_TOKEN_PATH race conditions
@@ -464,7 +372,7 @@ def test_phase_08_execute_fl_jobs(syft_managers):
             str(do1_job_location) if do1_job_location else "",
             str(do1_stdout_path),
             str(do1_stderr_path),
-            do1_result,
+            do1_queue,
         ),
         name="DO1-Client",
     )
@@ -477,24 +385,31 @@ def test_phase_08_execute_fl_jobs(syft_managers):
             str(do2_job_location) if do2_job_location else "",
             str(do2_stdout_path),
             str(do2_stderr_path),
-            do2_result,
+            do2_queue,
         ),
         name="DO2-Client",
     )
 
-    logger.info("Starting DS server and DO1/DO2 clients in parallel...")
-    logger.info("  DS: thread with subprocess.Popen")
     logger.info(
+        "Starting DS server and DO1/DO2 clients in parallel...\n"
+        "  DS: subprocess.Popen polled from the test thread\n"
         "  DO1/DO2: separate PROCESSES with isolated os.environ (truly parallel)"
     )
-    ds_thread.start()
+    ds_process = ds_start_fl_server(
+        fl_project, ds_env, ds_stdout_path, ds_stderr_path, python=ds_python
+    )
     do1_process.start()
     do2_process.start()
 
-    # Wait for all to complete
-    do1_process.join(timeout=660)  # 11 min timeout
-    do2_process.join(timeout=660)
-    ds_thread.join(timeout=660)
+    # Wait for all to complete, polling the DS server from this thread
+    ds_result = wait_for_fl_run(
+        ds_process,
+        [do1_process, do2_process],
+        ds_log_paths=(ds_stdout_path, ds_stderr_path),
+    )
+    logger.info(f"DS logs saved to: {ds_stdout_path}, {ds_stderr_path}")
+    do1_result = _collect_do_result(do1_queue)
+    do2_result = _collect_do_result(do2_queue)
 
     total_duration = time.time() - start_time
 
@@ -529,79 +444,42 @@ def test_phase_09_verify_training_results(syft_managers):
 
     do1_manager = syft_managers["do1"]
     do2_manager = syft_managers["do2"]
-    ds_manager = syft_managers["ds"]
 
-    # Sync results back to DS
-    do1_manager.sync()
-    do2_manager.sync()
-    sleep(2)
-    ds_manager.sync()
+    # Sync results back to DS (DO1 and DO2 touch disjoint Drive folders)
+    sync_managers(do1_manager, do2_manager)
 
-    # Get DO1 job results
-    do1_jobs = do1_manager.jobs
+    # Get DO1 job results (already synced above, read the local job list)
+    do1_jobs = do1_manager.job_client.jobs
     assert len(do1_jobs) > 0, "No jobs found for DO1"
     do1_job = do1_jobs[0]
 
-    # Read DO1 stdout
+    # Log DO1 stdout and stderr. The logs are only echoed, so they are read
+    # lazily: loguru skips the file reads when INFO is filtered out.
     logger.info("Reading DO1 job stdout...")
-    do1_stdout = str(do1_job.stdout)
-    logger.info(f"\nDO1 Output:\n{do1_stdout}\n")
-    do1_stderr = str(do1_job.stderr)
-    logger.info(f"\nDO1 Error Output:\n{do1_stderr}\n")
+    logger.opt(lazy=True).info(
+        "\nDO1 Output:\n{}\n", lambda: clip_log(str(do1_job.stdout))
+    )
+    logger.opt(lazy=True).info(
+        "\nDO1 Error Output:\n{}\n", lambda: clip_log(str(do1_job.stderr))
+    )
 
     # Get DO2 job results
-    do2_jobs = do2_manager.jobs
+    do2_jobs = do2_manager.job_client.jobs
     assert len(do2_jobs) > 0, "No jobs found for DO2"
     do2_job = do2_jobs[0]
 
     logger.info("Reading DO2 job stdout and stderr...")
-    do2_stdout = str(do2_job.stdout)
-    logger.info(f"\nDO2 Output:\n{do2_stdout}\n")
-    do2_stderr = str(do2_job.stderr)
-    logger.info(f"\nDO2 Error Output:\n{do2_stderr}\n")
+    logger.opt(lazy=True).info(
+        "\nDO2 Output:\n{}\n", lambda: clip_log(str(do2_job.stdout))
+    )
+    logger.opt(lazy=True).info(
+        "\nDO2 Error Output:\n{}\n", lambda: clip_log(str(do2_job.stderr))
+    )
 
     # =========================================================================
     # Verify trained weights are available for DS
     # =========================================================================
-    logger.info("\n" + "=" * 60)
-    logger.info("VERIFYING TRAINED WEIGHTS FOR DS")
-    logger.info("=" * 60)
-
-    # Weights are saved to OUTPUT_DIR/weights/ (set in Phase 8)
-    fl_output_dir = syft_managers.get("fl_output_dir")
-    if fl_output_dir:
-        weights_dir = fl_output_dir / "weights"
-    else:
-        # Fallback to default path
-        weights_dir = Path.home() / ".syftbox" / "rds" / "weights"
-
-    logger.info(f"Checking weights directory: {weights_dir}")
-
-    assert weights_dir.exists(), f"Weights directory not found: {weights_dir}"
-
-    # Find all .safetensors weight files
-    weight_files = list(weights_dir.glob("parameters_round_*.safetensors"))
-    logger.info(f"Found {len(weight_files)} weight file(s):")
-    for wf in sorted(weight_files):
-        file_size = wf.stat().st_size
-        logger.info(f"  - {wf.name} ({file_size} bytes)")
-
-    # Verify at least one weight file exists (from at least one FL round)
-    assert len(weight_files) > 0, "No trained weight files found!"
-
-    # Verify the latest weights file is readable
-    latest_weights = max(weight_files, key=lambda p: p.stat().st_mtime)
-    assert latest_weights.stat().st_size > 0, "Latest weights file is empty!"
-    logger.success(f"✅ DS can access trained weights: {latest_weights.name}")
-
-    # Load and verify the weights structure
-    from safetensors.numpy import load_file
-
-    weights_dict = load_file(str(latest_weights))
-    logger.info(f"  Weight layers: {list(weights_dict.keys())}")
-    logger.success("✅ Trained weights verified and loadable!")
-
-    logger.info("=" * 60)
+    ds_verify_trained_weights(syft_managers.get("fl_output_dir"))
 
     # Cleanup FL project temp directory
     fl_project = syft_managers.get("fl_project")
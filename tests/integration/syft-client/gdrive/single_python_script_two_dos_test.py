@@ -17,19 +17,20 @@ Prerequisites:
 Run: pytest tests/integration/syft-client/single_python_script_test.py -v -s
 """
 
-import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from time import sleep
 
 import pytest
 from loguru import logger
+from syft_client.sync.syftbox_manager import SyftboxManager
 
 from .common_rds_phases import (
     dos_approve_jobs,
     dos_upload_datasets,
     ds_discover_datasets,
 )
+from .utils import wait_until
 
 # Mark all tests in this module as slow (integration tests)
 pytestmark = pytest.mark.slow
@@ -38,9 +39,12 @@ pytestmark = pytest.mark.slow
 # Constants
 # ==============================================================================
 
-# Path to the analyze_diabetes.py script in assets
-ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
-ANALYZE_SCRIPT = ASSETS_DIR / "code" / "single_python_script" / "analyze_diabetes.py"
+# Path to the analyze_diabetes.py script in assets (tests/assets). Resolved
+# strictly at import, so a missing script fails collection instead of phase 5.
+ASSETS_DIR = Path(__file__).parent.parent.parent.parent / "assets"
+ANALYZE_SCRIPT = (
+    ASSETS_DIR / "code" / "single_python_script" / "analyze_diabetes.py"
+).resolve(strict=True)
 
 
 # ==============================================================================
@@ -79,41 +83,33 @@ def test_phase_05_submit_jobs(syft_managers):
     ds_manager = syft_managers["ds"]
     env = syft_managers["env"]
 
-    # Copy script to temp file (syft-client needs a fresh copy for each submission)
-    assert ANALYZE_SCRIPT.exists(), f"Script not found: {ANALYZE_SCRIPT}"
-    temp_dir = Path(tempfile.mkdtemp())
-    temp_script = temp_dir / "analyze_diabetes.py"
-    shutil.copy(ANALYZE_SCRIPT, temp_script)
-    logger.info(f"Copied script to temp: {temp_script}")
-
-    try:
-        # Submit job to DO1
-        logger.info(f"Submitting job to {env['EMAIL_DO1']}...")
-        ds_manager.submit_python_job(
-            user=env["EMAIL_DO1"],
-            code_path=str(temp_script),
-            job_name="diabetes-analysis",
-            dependencies=["pandas", "syft-client"],
-        )
-        logger.success("✅ Job submitted to DO1")
-
-        # Submit job to DO2
-        logger.info(f"Submitting job to {env['EMAIL_DO2']}...")
+    # submit_python_job() copies the script into the job directory and never
+    # modifies it, so the asset itself can be submitted without a temp copy
+    code_path = str(ANALYZE_SCRIPT)
+
+    # Submit one job per DO. This stays sequential on purpose: the DS's
+    # file change pusher queues a submission's files and sends them to the
+    # last queued file's datasite, so concurrent submissions through the
+    # same manager could mix files between the two DOs' messages.
+    for do_email, do_name in [
+        (env["EMAIL_DO1"], "DO1"),
+        (env["EMAIL_DO2"], "DO2"),
+    ]:
+        logger.info(f"Submitting job to {do_email}...")
         ds_manager.submit_python_job(
-            user=env["EMAIL_DO2"],
-            code_path=str(temp_script),
+            user=do_email,
+            code_path=code_path,
             job_name="diabetes-analysis",
             dependencies=["pandas", "syft-client"],
         )
-        logger.success("✅ Job submitted to DO2")
+        logger.success(f"✅ Job submitted to {do_name}")
 
-        # Wait for jobs to propagate
-        sleep(2)
-
-    finally:
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        logger.info("✅ Temp script cleaned up")
+    # Wait for the jobs to reach both DOs instead of sleeping a fixed time
+    # (.jobs syncs the DO's manager before listing)
+    do1_manager = syft_managers["do1"]
+    do2_manager = syft_managers["do2"]
+    if not wait_until(lambda: len(do1_manager.jobs) > 0 and len(do2_manager.jobs) > 0):
+        logger.warning("Jobs not yet visible to both DOs, continuing to approval")
 
     logger.success("✅ Phase 5 complete: Jobs submitted to both DOs")
 
@@ -135,6 +131,18 @@ def test_phase_06_dos_approve_jobs(syft_managers):
 # ==============================================================================
 
 
+def _do_accept_job(do_manager: SyftboxManager, do_name: str, result_path: str):
+    """Single DO accepts its approved job by depositing a mock result file."""
+    logger.info(f"{do_name} accepting job...")
+    jobs = do_manager.jobs
+    assert len(jobs) > 0, f"No jobs found for {do_name}"
+    job = jobs[0]
+    assert job.status == "approved", f"{do_name} job not approved, status: {job.status}"
+
+    job.accept_by_depositing_result(result_path)
+    logger.success(f"✅ {do_name} job accepted with deposited result")
+
+
 def test_phase_07_dos_accept_jobs(syft_managers):
     """Phase 7: DOs accept jobs by depositing mock results.
 
@@ -143,9 +151,6 @@ def test_phase_07_dos_accept_jobs(syft_managers):
     """
     logger.info("Phase 7: DOs accepting jobs by depositing results...")
 
-    do1_manager = syft_managers["do1"]
-    do2_manager = syft_managers["do2"]
-
     # Create a mock result file to deposit
     result_content = """DIABETES DATASET ANALYSIS RESULTS
 ==================================
@@ -154,45 +159,23 @@ Analysis completed successfully.
 RESULT: SUCCESS
 """
 
-    # DO1 accepts job by depositing result
-    logger.info("DO1 accepting job...")
-    do1_jobs = do1_manager.jobs
-    assert len(do1_jobs) > 0, "No jobs found for DO1"
-    do1_job = do1_jobs[0]
-    assert (
-        do1_job.status == "approved"
-    ), f"DO1 job not approved, status: {do1_job.status}"
-
-    # Create temp result file and deposit it
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write(result_content)
-        do1_result_path = f.name
-
-    try:
-        do1_job.accept_by_depositing_result(do1_result_path)
-        logger.success("✅ DO1 job accepted with deposited result")
-    finally:
-        Path(do1_result_path).unlink(missing_ok=True)
-
-    # DO2 accepts job by depositing result
-    logger.info("DO2 accepting job...")
-    do2_jobs = do2_manager.jobs
-    assert len(do2_jobs) > 0, "No jobs found for DO2"
-    do2_job = do2_jobs[0]
-    assert (
-        do2_job.status == "approved"
-    ), f"DO2 job not approved, status: {do2_job.status}"
-
-    # Create temp result file and deposit it
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write(result_content)
-        do2_result_path = f.name
-
-    try:
-        do2_job.accept_by_depositing_result(do2_result_path)
-        logger.success("✅ DO2 job accepted with deposited result")
-    finally:
-        Path(do2_result_path).unlink(missing_ok=True)
+    # Write the result once for both DOs: depositing copies the file into the
+    # job's outputs directory and leaves the original untouched. The file keeps
+    # its name there, so give it a stable one instead of a random temp name.
+    with tempfile.TemporaryDirectory() as result_dir:
+        result_path = Path(result_dir) / "result.txt"
+        result_path.write_text(result_content)
+
+        # Each DO deposits through its own manager, so both can run at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            do1_accept = executor.submit(
+                _do_accept_job, syft_managers["do1"], "DO1", str(result_path)
+            )
+            do2_accept = executor.submit(
+                _do_accept_job, syft_managers["do2"], "DO2", str(result_path)
+            )
+            do1_accept.result()  # Re-raise assertion errors from the DO
+            do2_accept.result()
 
     logger.success("✅ Phase 7 complete: Both DOs accepted jobs")
 
@@ -202,42 +185,44 @@ RESULT: SUCCESS
 # ==============================================================================
 
 
+def _verify_do_job_done(do_manager: SyftboxManager, do_name: str):
+    """Check a DO's job is done and has deposited outputs.
+
+    Returns:
+        Tuple of (job, output paths), for the summary
+    """
+    # Snapshot once: `.jobs` syncs the DO with Drive on every access, and
+    # `output_paths` lists the outputs directory on every access
+    jobs = do_manager.jobs
+    assert len(jobs) > 0, f"No jobs found for {do_name}"
+    job = jobs[0]
+    assert job.status == "done", f"{do_name} job not done, status: {job.status}"
+
+    # Check the DO has output files
+    outputs = job.output_paths
+    assert len(outputs) > 0, f"{do_name} job has no output files"
+    logger.opt(lazy=True).info(
+        "{} job outputs: {}", lambda: do_name, lambda: [p.name for p in outputs]
+    )
+    logger.success(f"✅ {do_name} job verified: status=done, outputs deposited")
+
+    return job, outputs
+
+
 def test_phase_08_verify_results(syft_managers):
     """Phase 8: Verify that jobs are marked as done and results are deposited."""
     logger.info("Phase 8: Verifying job results...")
 
     do1_manager = syft_managers["do1"]
     do2_manager = syft_managers["do2"]
-    ds_manager = syft_managers["ds"]
 
-    # DS syncs to get latest state
-    logger.info("DS syncing to get latest job status...")
-    ds_manager.sync()
-    sleep(1)
-
-    # Verify DO1 job is done
-    do1_jobs = do1_manager.jobs
-    assert len(do1_jobs) > 0, "No jobs found for DO1"
-    do1_job = do1_jobs[0]
-    assert do1_job.status == "done", f"DO1 job not done, status: {do1_job.status}"
-
-    # Check DO1 has output files
-    do1_outputs = do1_job.output_paths
-    assert len(do1_outputs) > 0, "DO1 job has no output files"
-    logger.info(f"DO1 job outputs: {[p.name for p in do1_outputs]}")
-    logger.success("✅ DO1 job verified: status=done, outputs deposited")
-
-    # Verify DO2 job is done
-    do2_jobs = do2_manager.jobs
-    assert len(do2_jobs) > 0, "No jobs found for DO2"
-    do2_job = do2_jobs[0]
-    assert do2_job.status == "done", f"DO2 job not done, status: {do2_job.status}"
-
-    # Check DO2 has output files
-    do2_outputs = do2_job.output_paths
-    assert len(do2_outputs) > 0, "DO2 job has no output files"
-    logger.info(f"DO2 job outputs: {[p.name for p in do2_outputs]}")
-    logger.success("✅ DO2 job verified: status=done, outputs deposited")
+    # Verify both DO jobs are done. Every assertion reads DO-side state, so no DS
+    # sync is needed; each check syncs its own DO's manager, so both run at once.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        do1_check = executor.submit(_verify_do_job_done, do1_manager, "DO1")
+        do2_check = executor.submit(_verify_do_job_done, do2_manager, "DO2")
+        do1_job, do1_outputs = do1_check.result()  # Re-raise assertion errors
+        do2_job, do2_outputs = do2_check.result()
 
     # Summary
     logger.info("\n" + "=" * 60)
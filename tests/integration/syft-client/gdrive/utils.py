@@ -5,14 +5,31 @@ This module provides reusable helper functions for:
 - Google Drive token creation
 - SyftBox cleanup
 - Event message deletion
+- FL project cloning
+- Condition polling and retries
+- Concurrent manager sync
+- Subprocess helpers (venv caching, lifetime)
 - File utilities
 """
 
+import ctypes
+import glob
+import hashlib
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from googleapiclient.errors import HttpError
 from loguru import logger
-from syft_client.sync.syftbox_manager import SyftboxManager
-from typing_extensions import Any
+from syft_client.sync.syftbox_manager import SyftboxManager, SyftboxManagerConfig
+from typing_extensions import Any, Callable
 
 # ==============================================================================
 # Constants
@@ -22,9 +39,22 @@ from typing_extensions import Any
 SYFT_EVENT_MESSAGE_PREFIX = "syfteventsmessagev3_"
 SYFT_EVENT_MESSAGE_PREFIX_V2 = "msgv2_"  # Older format
 
+# Drive search query for both v2 (msgv2_*) and v3 (syfteventsmessagev3_*) messages
+SYFT_EVENT_MESSAGE_QUERY = (
+    f"(name contains '{SYFT_EVENT_MESSAGE_PREFIX}' or "
+    f"name contains '{SYFT_EVENT_MESSAGE_PREFIX_V2}') and trashed=false"
+)
+
 # Google Drive OAuth scopes
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
+# Maximum number of calls Google Drive accepts in a single HTTP batch request
+DRIVE_BATCH_LIMIT = 100
+# Maximum page size of Google Drive files().list()
+DRIVE_LIST_PAGE_SIZE = 1000
+# Google API statuses worth retrying: rate limiting and transient server errors
+TRANSIENT_GOOGLE_API_STATUSES = (429, 500, 502, 503, 504)
+
 # Project paths
 SYFT_FLWR_DIR = Path(__file__).parent.parent.parent.parent.parent  # syft-flwr root
 CREDENTIALS_DIR = SYFT_FLWR_DIR / "credentials"
@@ -32,7 +62,22 @@ ENV_FILE = CREDENTIALS_DIR / ".env"
 FL_PROJECT_DIR = (
     SYFT_FLWR_DIR / "notebooks" / "fl-diabetes-prediction" / "fl-diabetes-prediction"
 )
-TEST_LOGS_DIR = Path("/tmp/syft_flwr_test_logs")
+# Scratch area for FL project clones and logs. Point SYFT_FLWR_TEST_TMP at a
+# tmpfs (e.g. /dev/shm) on CI machines with slow disks.
+TEST_TMP_ROOT = Path(os.environ.get("SYFT_FLWR_TEST_TMP", tempfile.gettempdir()))
+TEST_LOGS_DIR = TEST_TMP_ROOT / "syft_flwr_test_logs"
+UV_VENV_CACHE_DIR = Path.home() / ".cache" / "syft_flwr_test_venvs"
+
+# FL project files rewritten in place (bootstrap() / `uv sync`), never hardlinked
+FL_PROJECT_MUTABLE_FILES = ("pyproject.toml", "uv.lock")
+
+# prctl(2) option: signal delivered to this process when its parent dies
+PR_SET_PDEATHSIG = 1
+# Resolved once at import: a preexec_fn runs between fork and exec, where
+# loading a library could deadlock on locks held by the parent's other threads
+_LIBC_PRCTL = (
+    ctypes.CDLL("libc.so.6", use_errno=True).prctl if sys.platform == "linux" else None
+)
 
 
 # ==============================================================================
@@ -60,11 +105,93 @@ def create_token(cred_path: Path, token_path: Path, scopes: list = None):
     return creds
 
 
+# ==============================================================================
+# Manager Creation
+# ==============================================================================
+
+
+def create_drive_manager(email: str, token_path: Path, is_ds: bool) -> SyftboxManager:
+    """Create a standalone Google Drive SyftboxManager for one participant.
+
+    The manager is not paired with (or made a peer of) anyone else, unlike
+    pair_with_google_drive_testing_connection(). Both the test fixtures and the
+    Drive cleanup build their managers here.
+
+    Args:
+        email: Participant's email
+        token_path: Path to the participant's OAuth token
+        is_ds: True for the Data Scientist, False for a Data Owner
+    """
+    config = SyftboxManagerConfig.for_google_drive_testing_connection(
+        email=email,
+        token_path=token_path,
+        use_in_memory_cache=False,
+        only_ds=is_ds,
+        only_datasite_owner=not is_ds,
+    )
+    return SyftboxManager.from_config(config)
+
+
 # ==============================================================================
 # Google Drive Cleanup
 # ==============================================================================
 
 
+def _clean_participant_drive(
+    name: str, email: str, token_path: Path, only_ds: bool
+) -> int:
+    """Delete one participant's SyftBox, then the event messages in their Drive.
+
+    Args:
+        name: Participant name for logging (e.g., "DO1", "DS")
+        email: Participant's email
+        token_path: Path to the participant's OAuth token
+        only_ds: True for the Data Scientist, False for a Data Owner
+
+    Returns:
+        Number of event messages deleted
+    """
+    manager = create_drive_manager(email, token_path, is_ds=only_ds)
+
+    # Resolve the Drive handles once, before the cleanup starts using them
+    router = manager.connection_router
+    drive_service = router.connections[0].drive_service
+
+    manager.delete_syftbox()
+    logger.info(f"  ✅ Deleted {name} SyftBox")
+
+    count = delete_event_messages_from_drive(
+        drive_service,
+        make_delete_service=lambda: router.connection_for_parallel_download().drive_service,
+    )
+    logger.info(f"  ✅ Deleted {count} event message(s) from {name}'s Drive")
+    return count
+
+
+def _clean_participant_drives(participants: dict[str, tuple[str, Path, bool]]) -> int:
+    """Clean up every participant's Drive concurrently.
+
+    Participants are separate Google accounts, so their cleanups only wait on
+    the network. Each worker thread also sets up its participant's manager
+    (token refresh, Drive service, SyftBox folder lookup), so that setup
+    overlaps too, and every manager stays on the thread that created it.
+
+    Args:
+        participants: Mapping of participant name to (email, token path, only_ds)
+
+    Returns:
+        Total number of event messages deleted
+    """
+    with ThreadPoolExecutor(max_workers=len(participants)) as executor:
+        counts = executor.map(
+            lambda participant: _clean_participant_drive(
+                participant[0], *participant[1]
+            ),
+            participants.items(),
+        )
+        return sum(counts)
+
+
 def remove_syftbox_single_do_from_drive(
     email_do, email_ds, token_path_do, token_path_ds
 ):
@@ -78,35 +205,15 @@ def remove_syftbox_single_do_from_drive(
     """
     logger.info("Cleaning up SyftBoxes from Google Drive (single DO)...")
 
-    ds_manager, do_manager = SyftboxManager.pair_with_google_drive_testing_connection(
-        do_email=email_do,
-        ds_email=email_ds,
-        do_token_path=token_path_do,
-        ds_token_path=token_path_ds,
-        add_peers=False,
+    # Delete SyftBoxes and event messages (syfteventsmessagev3_*) per participant
+    total = _clean_participant_drives(
+        {
+            "DO": (email_do, token_path_do, False),
+            "DS": (email_ds, token_path_ds, True),
+        }
     )
 
-    do_manager.delete_syftbox()
-    logger.info("  ✅ Deleted DO SyftBoxes")
-
-    ds_manager.delete_syftbox()
-    logger.info("  ✅ Deleted DS SyftBoxes")
-
     logger.success("✅ SyftBoxes cleaned up from Google Drive (single DO)")
-
-    # Clean up event messages
-    logger.info("Cleaning up syft event messages from Google Drive...")
-
-    do_drive = do_manager.connection_router.connections[0].drive_service
-    ds_drive = ds_manager.connection_router.connections[0].drive_service
-
-    do_count = delete_event_messages_from_drive(do_drive)
-    logger.info(f"  ✅ Deleted {do_count} event message(s) from DO's Drive")
-
-    ds_count = delete_event_messages_from_drive(ds_drive)
-    logger.info(f"  ✅ Deleted {ds_count} event message(s) from DS's Drive")
-
-    total = do_count + ds_count
     logger.success(f"✅ Cleaned up {total} event message(s) total")
 
 
@@ -116,58 +223,24 @@ def remove_syftboxes_from_drive(
     """Clean up Google Drive by deleting all SyftBox folders and event messages for all 3 participants."""
     logger.info("Cleaning up SyftBoxes from Google Drive...")
 
-    # Clean DO1 + DS
-    ds_manager1, do1_manager = SyftboxManager.pair_with_google_drive_testing_connection(
-        do_email=email_do1,
-        ds_email=email_ds,
-        do_token_path=token_path_do1,
-        ds_token_path=token_path_ds,
-        add_peers=False,
+    # Delete SyftBoxes and event messages (syfteventsmessagev3_*) per participant.
+    # Each participant gets one standalone manager: the DS is set up once for
+    # both DOs, instead of pairing it (OAuth + Drive connection) with each DO.
+    total = _clean_participant_drives(
+        {
+            "DO1": (email_do1, token_path_do1, False),
+            "DO2": (email_do2, token_path_do2, False),
+            "DS": (email_ds, token_path_ds, True),
+        }
     )
 
-    # Clean DO2
-    ds_manager2, do2_manager = SyftboxManager.pair_with_google_drive_testing_connection(
-        do_email=email_do2,
-        ds_email=email_ds,
-        do_token_path=token_path_do2,
-        ds_token_path=token_path_ds,
-        add_peers=False,
-    )
-
-    do1_manager.delete_syftbox()
-    logger.info("  ✅ Deleted DO1 SyftBoxes")
-    do2_manager.delete_syftbox()
-    logger.info("  ✅ Deleted DO2 SyftBoxes")
-
-    ds_manager1.delete_syftbox()
-    logger.info("  ✅ Deleted DS SyftBoxes (from DO1 pair)")
-    ds_manager2.delete_syftbox()
-    logger.info("  ✅ Deleted DS SyftBoxes (from DO2 pair)")
-
     logger.success("✅ All SyftBoxes cleaned up from Google Drive")
-
-    # Clean up event messages (syfteventsmessagev3_*) from all participants' Drives
-    logger.info("Cleaning up syft event messages from Google Drive...")
-
-    # Get drive_service from each manager's connection
-    do1_drive = do1_manager.connection_router.connections[0].drive_service
-    do2_drive = do2_manager.connection_router.connections[0].drive_service
-    ds_drive = ds_manager1.connection_router.connections[0].drive_service
-
-    do1_count = delete_event_messages_from_drive(do1_drive)
-    logger.info(f"  ✅ Deleted {do1_count} event message(s) from DO1's Drive")
-
-    do2_count = delete_event_messages_from_drive(do2_drive)
-    logger.info(f"  ✅ Deleted {do2_count} event message(s) from DO2's Drive")
-
-    ds_count = delete_event_messages_from_drive(ds_drive)
-    logger.info(f"  ✅ Deleted {ds_count} event message(s) from DS's Drive")
-
-    total = do1_count + do2_count + ds_count
     logger.success(f"✅ Cleaned up {total} event message(s) total")
 
 
-def delete_event_messages_from_drive(drive_service: Any) -> int:
+def delete_event_messages_from_drive(
+    drive_service: Any, make_delete_service: Callable[[], Any] | None = None
+) -> int:
     """
     Delete all syft event message files (v2 and v3) from Google Drive.
 
@@ -176,55 +249,337 @@ def delete_event_messages_from_drive(drive_service: Any) -> int:
 
     Args:
         drive_service: Google Drive API service instance
+        make_delete_service: Creates a second Drive service to delete from a
+            background thread (a service must not be shared across threads).
+            When given and the messages span several pages, each page is
+            deleted while the next one is listed.
 
     Returns:
         Number of files deleted
     """
-    # Search for both v2 (msgv2_*) and v3 (syfteventsmessagev3_*) message formats
-    query = (
-        f"(name contains '{SYFT_EVENT_MESSAGE_PREFIX}' or "
-        f"name contains '{SYFT_EVENT_MESSAGE_PREFIX_V2}') and trashed=false"
-    )
     deleted_count = 0
 
+    def _on_delete(request_id, response, exception):
+        nonlocal deleted_count
+        if exception is not None:
+            logger.warning(
+                f"    Failed to delete event message {request_id}: {exception}"
+            )
+        else:
+            deleted_count += 1
+
+    def _delete_files(service: Any, files: list[dict]):
+        # Delete in HTTP batches: one round-trip per batch instead of per file
+        for start in range(0, len(files), DRIVE_BATCH_LIMIT):
+            chunk = files[start : start + DRIVE_BATCH_LIMIT]
+            batch = service.new_batch_http_request(callback=_on_delete)
+            for file in chunk:
+                batch.add(
+                    service.files().delete(fileId=file["id"]),
+                    request_id=file["id"],
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning(
+                    f"    Failed to delete batch of {len(chunk)} messages: {e}"
+                )
+
+    # A single worker deletes the pages in order, one at a time. The second
+    # service is only created once there is a next page to list meanwhile.
+    deleter = ThreadPoolExecutor(max_workers=1)
+    delete_service = None
     try:
         page_token = None
         while True:
             results = (
                 drive_service.files()
                 .list(
-                    q=query,
-                    fields="nextPageToken, files(id, name)",
-                    pageSize=100,
+                    q=SYFT_EVENT_MESSAGE_QUERY,
+                    # Only IDs are needed to delete, keep the responses small
+                    fields="nextPageToken, files(id)",
+                    pageSize=DRIVE_LIST_PAGE_SIZE,
+                    spaces="drive",
+                    corpora="user",
                     pageToken=page_token,
                 )
                 .execute()
             )
 
             files = results.get("files", [])
-            for file in files:
-                try:
-                    drive_service.files().delete(fileId=file["id"]).execute()
-                    logger.debug(f"    Deleted event message: {file['name']}")
-                    deleted_count += 1
-                except Exception as e:
-                    logger.warning(f"    Failed to delete {file['name']}: {e}")
-
             page_token = results.get("nextPageToken")
+
+            if page_token and make_delete_service and delete_service is None:
+                delete_service = make_delete_service()
+            if delete_service is not None:
+                deleter.submit(_delete_files, delete_service, files)
+            else:
+                _delete_files(drive_service, files)
+
             if not page_token:
                 break
 
     except Exception as e:
         logger.error(f"Error searching for event messages: {e}")
+    finally:
+        deleter.shutdown(wait=True)
 
     return deleted_count
 
 
+# ==============================================================================
+# FL Project Cloning
+# ==============================================================================
+
+
+def _link_or_copy(src, dst):
+    """Hardlink ``src`` to ``dst``, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def clone_fl_project(src: Path, dst: Path, exclude: tuple[str, ...] = ()) -> None:
+    """Clone an FL project directory using hardlinks instead of copying file contents.
+
+    Files in ``FL_PROJECT_MUTABLE_FILES`` are real copies, since they are rewritten
+    in place and would otherwise modify the source project through the hardlink.
+
+    Args:
+        src: Source FL project directory
+        dst: Destination directory (must not exist)
+        exclude: Top-level file names to leave out of the clone
+    """
+    shutil.copytree(
+        src,
+        dst,
+        copy_function=_link_or_copy,
+        ignore=lambda dir_path, names: [
+            name for name in names if Path(dir_path) == src and name in exclude
+        ],
+    )
+    for name in FL_PROJECT_MUTABLE_FILES:
+        path = dst / name
+        if path.exists():
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            shutil.copy2(path, tmp_path)
+            tmp_path.replace(path)
+
+
+# ==============================================================================
+# Subprocess Utilities
+# ==============================================================================
+
+
+def cached_project_venv(project_dir: Path) -> Path:
+    """Get a persistent virtualenv path for an FL project, keyed by its dependencies.
+
+    Pass the result as ``UV_PROJECT_ENVIRONMENT`` to ``uv sync``/``uv run`` so that
+    repeated test runs on an unchanged project reuse the same warm environment
+    instead of resolving and installing into a fresh ``.venv`` in a temp dir.
+
+    Only the ``[project]`` table of pyproject.toml is hashed: bootstrap() stamps
+    ``[tool.syft_flwr]`` with a per-run app name, which doesn't affect the venv.
+
+    Args:
+        project_dir: FL project directory containing pyproject.toml (and uv.lock)
+
+    Returns:
+        Path to the cached virtualenv directory (may not exist yet)
+    """
+    digest = hashlib.sha256()
+    with open(project_dir / "pyproject.toml", "rb") as f:
+        project = tomllib.load(f).get("project", {})
+    digest.update(json.dumps(project, sort_keys=True).encode())
+    lock_path = project_dir / "uv.lock"
+    if lock_path.exists():
+        digest.update(lock_path.read_bytes())
+    return UV_VENV_CACHE_DIR / digest.hexdigest()[:16]
+
+
+def open_log_fd(path: Path) -> int:
+    """Open (and truncate) a log file as a raw descriptor for a subprocess to write to."""
+    return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+
+def drop_log_cache(*paths: Path) -> None:
+    """Hint the kernel to drop finished log files' pages from the page cache.
+
+    Call once the writer has exited. The data is flushed first, since
+    ``POSIX_FADV_DONTNEED`` only evicts clean pages. No-op on platforms without
+    posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def kill_on_parent_death():
+    """Make the calling process receive SIGKILL when its parent dies (Linux only).
+
+    Meant to be passed as ``preexec_fn`` to ``subprocess.Popen`` so that long-running
+    children (e.g. the DS Flower server) don't outlive a crashed or killed test run.
+    """
+    _LIBC_PRCTL(PR_SET_PDEATHSIG, signal.SIGKILL)
+
+
+# ==============================================================================
+# Polling Utilities
+# ==============================================================================
+
+
+def wait_until(
+    condition: Callable[[], bool],
+    timeout: float = 30.0,
+    initial_delay: float = 0.1,
+    max_delay: float = 1.0,
+) -> bool:
+    """Poll a condition with exponential backoff instead of sleeping a fixed time.
+
+    Args:
+        condition: Callable returning True once the awaited state is observable
+        timeout: Maximum time to wait in seconds
+        initial_delay: Delay before the second check in seconds
+        max_delay: Upper bound for the delay between checks in seconds
+
+    Returns:
+        True if the condition was met within the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        if condition():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, max_delay)
+
+
+def is_transient_google_error(error: Exception) -> bool:
+    """Whether a Google API error is worth retrying (rate limit or 5xx)."""
+    return (
+        isinstance(error, HttpError)
+        and error.resp.status in TRANSIENT_GOOGLE_API_STATUSES
+    )
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read a numeric ``Retry-After`` header from a Google API error, if any."""
+    if not isinstance(error, HttpError):
+        return None
+    try:
+        return float(error.resp.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_backoff(
+    func: Callable[[], Any],
+    max_attempts: int = 3,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    is_retryable: Callable[[Exception], bool] = is_transient_google_error,
+    description: str = "Call",
+) -> Any:
+    """Call ``func``, retrying retryable errors with exponential backoff.
+
+    A ``Retry-After`` header on the error response (e.g. with 429 Too Many
+    Requests) takes precedence over the computed delay.
+
+    Args:
+        func: Callable to run
+        max_attempts: Total number of attempts, including the first one
+        initial_delay: Delay before the first retry in seconds
+        max_delay: Upper bound for the delay between attempts in seconds
+        is_retryable: Decides whether an error is transient
+        description: What is being attempted, for logging
+
+    Returns:
+        Whatever ``func`` returns
+    """
+    delay = initial_delay
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == max_attempts or not is_retryable(e):
+                raise
+            wait = _retry_after_seconds(e) or delay
+            logger.warning(
+                f"{description} got a transient error "
+                f"(attempt {attempt}/{max_attempts}), retrying in {wait:.1f}s: {e}"
+            )
+            time.sleep(wait)
+            delay = min(delay * 2, max_delay)
+
+
+# ==============================================================================
+# Concurrent Manager Sync
+# ==============================================================================
+
+
+def sync_managers(*managers: SyftboxManager) -> None:
+    """Sync several SyftboxManagers concurrently.
+
+    Each manager talks to Google Drive through its own authenticated service, so
+    their network round-trips can overlap. Never pass the same manager twice: a
+    single manager's transport is not thread-safe.
+
+    Args:
+        managers: Distinct managers to sync
+    """
+    with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+        # Consume the results so exceptions from sync() propagate
+        list(executor.map(lambda manager: manager.sync(), managers))
+
+
 # ==============================================================================
 # File Utilities
 # ==============================================================================
 
 
+def stat_weight_files(weights_dir: Path) -> dict:
+    """Collect FL weight files and their stat results in a single directory scan.
+
+    Args:
+        weights_dir: Directory the FL server saves its weights to
+
+    Returns:
+        Dict mapping each ``parameters_round_*.safetensors`` path to its stat result
+    """
+    with os.scandir(weights_dir) as entries:
+        return {
+            Path(entry.path): entry.stat()
+            for entry in entries
+            if entry.name.startswith("parameters_round_")
+            and entry.name.endswith(".safetensors")
+        }
+
+
+def clip_log(text: str, limit: int = 4000) -> str:
+    """Keep only the head and tail of a long log before echoing it to the test output.
+
+    Args:
+        text: Log content (e.g. a job's stdout)
+        limit: Characters kept from each end
+
+    Returns:
+        The text unchanged if short enough, otherwise its head and tail
+    """
+    if len(text) <= 2 * limit:
+        return text
+    return f"{text[:limit]}\n...[truncated]...\n{text[-limit:]}"
+
+
 def has_file(root_dir, filename):
     """Check if a file exists anywhere in the directory tree.
 
@@ -235,4 +590,5 @@ def has_file(root_dir, filename):
     Returns:
         True if file exists, False otherwise
     """
-    return any(p.name == filename for p in Path(root_dir).rglob("*"))
+    # Let the glob engine match the name and stop at the first hit
+    return next(Path(root_dir).rglob(glob.escape(filename)), None) is not None
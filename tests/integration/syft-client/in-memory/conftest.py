@@ -108,3 +108,26 @@ def in_memory_managers_no_peers():
     yield ds_manager, do1_manager
 
     logger.info("Cleaning up in-memory managers...")
+
+
+@pytest.fixture(scope="session")
+def canonical_dataset(tmp_path_factory):
+    """Create a small mock/private CSV dataset once per session.
+
+    Tests only read these files (create_dataset copies them into the DO's
+    syftbox), so they can all share one copy.
+
+    Returns:
+        Path: dataset root with "mock/data.csv" and "private/data.csv"
+    """
+    dataset_dir = tmp_path_factory.mktemp("dataset")
+
+    mock_dir = dataset_dir / "mock"
+    private_dir = dataset_dir / "private"
+    mock_dir.mkdir()
+    private_dir.mkdir()
+
+    (mock_dir / "data.csv").write_text("id,value\n1,100\n2,200")
+    (private_dir / "data.csv").write_text("id,value,secret\n1,100,abc\n2,200,xyz")
+
+    return dataset_dir
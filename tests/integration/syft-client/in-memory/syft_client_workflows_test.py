@@ -13,9 +13,6 @@ Test coverage:
 Run with: pytest tests/integration/syft-client/in-memory/ -v
 """
 
-import tempfile
-from pathlib import Path
-
 from loguru import logger
 
 # =============================================================================
@@ -35,7 +32,7 @@ def test_peer_request_approval_flow(in_memory_managers_no_peers):
     ds_manager.add_peer(do_manager.email)
 
     # DS should now have DO as a peer
-    ds_peer_emails = [p.email for p in ds_manager.peers]
+    ds_peer_emails = {p.email for p in ds_manager.peers}
     assert (
         do_manager.email in ds_peer_emails
     ), f"DO should be in DS peers: {ds_peer_emails}"
@@ -53,7 +50,7 @@ def test_peer_request_approval_flow(in_memory_managers_no_peers):
 
     # Verify DO has DS as approved peer
     approved_peers = do_manager._approved_peers
-    approved_emails = [p.email for p in approved_peers]
+    approved_emails = {p.email for p in approved_peers}
     assert (
         ds_manager.email in approved_emails
     ), f"DS should be approved: {approved_emails}"
@@ -66,7 +63,7 @@ def test_peer_connection_established(in_memory_managers_single_do):
     ds_manager, do_manager = in_memory_managers_single_do
 
     # With add_peers=True, peers should already be established
-    ds_peer_emails = [p.email for p in ds_manager.peers]
+    ds_peer_emails = {p.email for p in ds_manager.peers}
     assert (
         do_manager.email in ds_peer_emails
     ), f"DO should be in DS peers: {ds_peer_emails}"
@@ -128,8 +125,7 @@ def test_job_submission_blocked_without_peer_approval(in_memory_managers_no_peer
     do_cache = do_manager.proposed_file_change_handler.event_cache
     assert len(do_cache.file_hashes) == 0, "Cache should be empty - peer not approved"
 
-    # Now DO approves the peer request
-    do_manager.load_peers()
+    # Now DO approves the peer request (the sync above already loaded it)
     do_manager.approve_peer_request(ds_manager.email)
 
     # DO syncs again - now it should work
@@ -146,36 +142,23 @@ def test_job_submission_blocked_without_peer_approval(in_memory_managers_no_peer
 # =============================================================================
 
 
-def test_dataset_creation_in_memory(in_memory_managers_single_do):
+def test_dataset_creation_in_memory(in_memory_managers_single_do, canonical_dataset):
     """Test that DO can create a dataset."""
     ds_manager, do_manager = in_memory_managers_single_do
 
-    # Create a temporary dataset
-    with tempfile.TemporaryDirectory() as temp_dir:
-        dataset_dir = Path(temp_dir)
-
-        # Create mock and private data files
-        mock_dir = dataset_dir / "mock"
-        private_dir = dataset_dir / "private"
-        mock_dir.mkdir()
-        private_dir.mkdir()
-
-        (mock_dir / "data.csv").write_text("id,value\n1,100\n2,200")
-        (private_dir / "data.csv").write_text("id,value,secret\n1,100,abc\n2,200,xyz")
-
-        # DO creates the dataset (syft_datasets API)
-        logger.info("DO creating dataset...")
-        do_manager.create_dataset(
-            name="test-dataset",
-            mock_path=mock_dir,
-            private_path=private_dir,
-        )
+    # DO creates the dataset (syft_datasets API)
+    logger.info("DO creating dataset...")
+    do_manager.create_dataset(
+        name="test-dataset",
+        mock_path=canonical_dataset / "mock",
+        private_path=canonical_dataset / "private",
+    )
 
-        # Verify dataset was created
-        datasets = do_manager.datasets
-        logger.info(f"DO datasets: {datasets.get_all()}")
+    # Verify dataset was created
+    datasets = do_manager.datasets
+    logger.info(f"DO datasets: {datasets.get_all()}")
 
-        assert len(datasets.get_all()) > 0, "DO should have at least one dataset"
+    assert len(datasets.get_all()) > 0, "DO should have at least one dataset"
 
     logger.success("Dataset creation completed successfully")
 
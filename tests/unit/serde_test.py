@@ -6,30 +6,54 @@ These tests verify syft-flwr's serde functions work correctly with flwr 1.25.0 A
 
 import time
 
+import pytest
 from flwr.common import ConfigRecord, Metadata, RecordDict
 from flwr.common.message import Message
 from loguru import logger
 
 from syft_flwr.serde import bytes_to_flower_message, flower_message_to_bytes
 
-
-def test_flower_message_serialization():
+# Metadata fields shared by every test message; cases override what they vary
+_BASE_METADATA = dict(
+    run_id=12345,
+    message_id="test-msg-001",
+    src_node_id=1,
+    dst_node_id=2,
+    reply_to_message_id="",
+    group_id="test-group",
+    ttl=300.0,
+    message_type="train",
+)
+
+
+def _make_metadata(**overrides) -> Metadata:
+    """Build test message metadata (flwr 1.25.0 API), overriding any field."""
+    return Metadata(**{**_BASE_METADATA, "created_at": time.time(), **overrides})
+
+
+@pytest.mark.parametrize(
+    "metadata_overrides, configs",
+    [
+        ({}, {}),
+        (
+            {
+                "run_id": 99999,
+                "message_id": "content-msg-001",
+                "group_id": "",
+                "ttl": 60.0,
+                "message_type": "evaluate",
+            },
+            {"config": {"batch_size": 32, "learning_rate": 0.01}},
+        ),
+    ],
+    ids=["empty_content", "with_config_content"],
+)
+def test_flower_message_serialization(metadata_overrides, configs):
     """Test Flower message serialization/deserialization roundtrip."""
-    # Create a test message (flwr 1.25.0 API)
-    metadata = Metadata(
-        run_id=12345,
-        message_id="test-msg-001",
-        src_node_id=1,
-        dst_node_id=2,
-        reply_to_message_id="",
-        group_id="test-group",
-        created_at=time.time(),
-        ttl=300.0,
-        message_type="train",
-    )
-
     content = RecordDict()
-    message = Message(metadata=metadata, content=content)
+    for name, config in configs.items():
+        content[name] = ConfigRecord(config)
+    message = Message(metadata=_make_metadata(**metadata_overrides), content=content)
 
     # Serialize
     serialized = flower_message_to_bytes(message)
@@ -40,45 +64,17 @@ def test_flower_message_serialization():
     deserialized = bytes_to_flower_message(serialized)
     assert isinstance(deserialized, Message), "Deserialized should be a Message"
 
-    # Verify roundtrip
+    # Verify metadata roundtrip
     assert deserialized.metadata.run_id == message.metadata.run_id
     assert deserialized.metadata.message_id == message.metadata.message_id
     assert deserialized.metadata.src_node_id == message.metadata.src_node_id
     assert deserialized.metadata.dst_node_id == message.metadata.dst_node_id
     assert deserialized.metadata.message_type == message.metadata.message_type
 
-    logger.success("FL message serialization roundtrip successful")
-
-
-def test_flower_message_serialization_with_content():
-    """Test Flower message serialization with actual content."""
-    # Create a message with content (flwr 1.25.0 API)
-    metadata = Metadata(
-        run_id=99999,
-        message_id="content-msg-001",
-        src_node_id=1,
-        dst_node_id=2,
-        reply_to_message_id="",
-        group_id="",
-        created_at=time.time(),
-        ttl=60.0,
-        message_type="evaluate",
-    )
-
-    # Add some config content
-    content = RecordDict()
-    content["config"] = ConfigRecord({"batch_size": 32, "learning_rate": 0.01})
-
-    message = Message(metadata=metadata, content=content)
-
-    # Roundtrip
-    serialized = flower_message_to_bytes(message)
-    deserialized = bytes_to_flower_message(serialized)
-
     # Verify content preserved
-    assert "config" in deserialized.content
-    config = deserialized.content["config"]
-    assert config["batch_size"] == 32
-    assert config["learning_rate"] == 0.01
+    for name, config in configs.items():
+        assert name in deserialized.content
+        for key, value in config.items():
+            assert deserialized.content[name][key] == value
 
-    logger.success("FL message with content serialization successful")
+    logger.success("FL message serialization roundtrip successful")